@@ -1,5 +1,5 @@
 
-\"\"\"Spectral integral I(T) and efficiency F(T).
+"""Spectral integral I(T) and efficiency F(T).
 
 This module evaluates
 
@@ -11,80 +11,237 @@ with μ_i = m_i c^2/(k_B T), and defines an effective efficiency
 
 up to an overall normalization that cancels when working with
 F(T)/F(T_0) and with normalized evaporation time τ=t/t_evap.fileciteturn0file1
-\"\"\"
+
+The integrals are evaluated with Gauss–Laguerre quadrature after the
+shift x = μ_i + t,
+
+    ∫_{μ}^∞ x^3 χ(x/4π) / (e^x ± 1) dx
+        = e^{-μ} ∫_0^∞ e^{-t} [x^3 χ(x/4π) / (1 ± e^{-x})] dt,
+
+whose bracket is smooth, so 48 nodes already exceed the accuracy of a
+600-point trapezoid rule on [μ, μ + 40].
+"""
 
 from __future__ import annotations
 
+import math
+from functools import lru_cache
 from typing import Tuple
 
 import numpy as np
 
-from .greybody import Species, species_set, chi_s_y, k_B_eV_per_K
+from .greybody import species_soa, species_version, chi_s_y, k_B_eV_per_K
 
 
-def _I_species(T: float, spec: Species, n_x: int = 600) -> float:
-    \"\"\"Integral contribution I_i(T) of a single species.
+# Default number of Gauss–Laguerre nodes, and the threshold below which
+# μ is dropped so that a species shares the T-independent massless kernel
+# (the relative error is O(μ)).
+_N_NODES = 48
+_MU_FLOOR = 1e-6
 
-    Parameters
-    ----------
-    T : float
-        Hawking temperature in Kelvin.
-    spec : Species
-        Particle species (g, m, spin, fermion/boson).
-    n_x : int
-        Number of points in the x-grid.
+# laggauss overflows (NaN weights) from about 190 nodes on.
+_MAX_NODES = 180
 
-    Returns
-    -------
-    I_i(T) : float
-        Dimensionless integral contribution of this species.
-    \"\"\"
-    m_eV = spec.mass_eV
-    s = spec.spin
-    fermion = spec.fermion
-    g = spec.g
-
-    if m_eV <= 0.0:
-        mu = 0.0
-    else:
-        mu = m_eV / (k_B_eV_per_K * T)
 
-    x_min = max(mu, 1e-6)
-    x_max = max(mu + 40.0, 40.0)
-    xs = np.linspace(x_min, x_max, n_x)
+@lru_cache(maxsize=None)
+def _laguerre(n_x: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Gauss–Laguerre nodes and weights for ∫_0^∞ e^{-t} f(t) dt.
+
+    ``n_x`` is the number of nodes and must lie in [1, 180]; other values
+    raise ValueError.
+    """
+    if not 1 <= n_x <= _MAX_NODES:
+        raise ValueError(
+            f"n_x is the number of Gauss–Laguerre nodes and must be in "
+            f"[1, {_MAX_NODES}] (default {_N_NODES}); got {n_x}"
+        )
+    return np.polynomial.laguerre.laggauss(n_x)
+
 
-    y = xs / (4.0 * np.pi)
-    chi = chi_s_y(y, s)
+def _kernel(xs: np.ndarray, s: float) -> np.ndarray:
+    """x^3 χ_s(x/4π)."""
+    return xs * xs * xs * chi_s_y(xs / (4.0 * np.pi), s)
 
-    den = np.exp(xs)
-    if fermion:
-        den = den + 1.0
+
+def _occupation(xs: np.ndarray, fermion) -> np.ndarray:
+    """1 / (1 ± e^{-x}), computed in a single buffer.
+
+    Both denominators come from one expm1 call, e = e^{-x} - 1: the Fermi
+    one is e + 2 and the Bose one is -e, which keeps full precision at the
+    small-x Laguerre nodes. ``fermion`` is a bool, or one bool per row of
+    a 2D ``xs``.
+    """
+    buf = np.negative(xs)
+    np.expm1(buf, out=buf)
+    if np.ndim(fermion) == 0:
+        if fermion:
+            buf += 2.0
+        else:
+            np.negative(buf, out=buf)
     else:
-        den = den - 1.0
-        den[den <= 0] = np.exp(xs[den <= 0])
+        f = np.asarray(fermion)[:, None]
+        buf *= np.where(f, 1.0, -1.0)
+        buf += np.where(f, 2.0, 0.0)
+    np.reciprocal(buf, out=buf)
+    return buf
+
+
+@lru_cache(maxsize=None)
+def _massless_kernel(n_x: int, s: float) -> np.ndarray:
+    """x^3 χ_s(x/4π) at the Laguerre nodes (μ = 0)."""
+    t, _ = _laguerre(n_x)
+    return _kernel(t, s)
+
+
+@lru_cache(maxsize=128)
+def _massless_integral(n_x: int, s: float, fermion: bool) -> float:
+    """∫_0^∞ x^3 χ_s(x/4π) / (e^x ± 1) dx, which does not depend on T."""
+    t, w = _laguerre(n_x)
+    return float(np.dot(w, _massless_kernel(n_x, s) * _occupation(t, fermion)))
+
+
+@lru_cache(maxsize=None)
+def _massless_rows(n_x: int, version: int) -> np.ndarray:
+    """μ = 0 integrals (without g) of every species in :data:`species_soa`.
+
+    ``version`` is :func:`greybody.species_version`, so the table is
+    rebuilt whenever the particle content changes and is otherwise a
+    single cache lookup.
+    """
+    return np.array([
+        _massless_integral(n_x, s, f)
+        for s, f in zip(species_soa["spin"].tolist(), species_soa["fermion"].tolist())
+    ])
+
 
-    integrand = xs**3 * chi / den
-    integral = np.trapz(integrand, xs)
-    return g * integral
+def _chi_rows(Y: np.ndarray, spins: np.ndarray) -> np.ndarray:
+    """χ_s(y) for a stack of grids, row i evaluated at spin spins[i]."""
+    chi = np.empty_like(Y)
+    for s in set(spins.tolist()):
+        rows = spins == s
+        chi[rows] = chi_s_y(Y[rows], s)
+    return chi
 
 
-def I_of_T(T: float, n_x: int = 600) -> float:
-    \"\"\"Total dimensionless spectral integral I(T).\"\"\"
-    return sum(_I_species(T, spec, n_x=n_x) for spec in species_set)
+def I_of_T(T: float, n_x: int = _N_NODES) -> float:
+    """Total dimensionless spectral integral I(T).
 
+    Works on the arrays of :data:`species_soa`. Species with negligible μ
+    contribute cached T-independent integrals; the massive ones are
+    integrated together on an (n_massive, n_x) node grid.
 
-def F_of_T(T: float, n_x: int = 600) -> float:
-    \"\"\"Effective spectral efficiency F(T).
+    ``n_x`` is the number of Gauss–Laguerre nodes (1 to 180, default 48);
+    larger values raise ValueError.
+    """
+    I_rows = _massless_rows(n_x, species_version())
+    g = species_soa["g"]
+    mass = species_soa["mass_eV"]
+    spin = species_soa["spin"]
+    fermion = species_soa["fermion"]
+
+    mu = mass / (k_B_eV_per_K * T)
+    massive = mu > _MU_FLOOR
+    if not massive.any():
+        return float(g @ I_rows)
+
+    t, w = _laguerre(n_x)
+    mu_m = mu[massive]
+    X = mu_m[:, None] + t
+    K = X * X * X * _chi_rows(X / (4.0 * np.pi), spin[massive])
+    K *= _occupation(X, fermion[massive])
+
+    I_massive = np.exp(-mu_m) * (K @ w)
+    return float(g[~massive] @ I_rows[~massive] + g[massive] @ I_massive)
+
+
+def _I_of_T_batch(
+    T: np.ndarray, n_x: int = _N_NODES, dtype: np.dtype = np.float64
+) -> np.ndarray:
+    """I(T) for a 1D array of temperatures.
+
+    Loops over species only. For each massive species the nodes of all
+    temperatures form one (n_T, n_x) matrix, so exp and the quadrature
+    sum run once over the whole batch. A species with negligible μ
+    contributes a T-independent constant.
+
+    ``dtype`` sets the precision of the (n_T, n_x) integrand matrices;
+    μ, the e^{-μ} prefactor and the result stay float64.
+    """
+    T = np.asarray(T, dtype=float)
+    species_version()  # syncs species_soa with species_set
+    t, w = _laguerre(n_x)
+    t = t.astype(dtype, copy=False)
+    w = w.astype(dtype, copy=False)
+
+    total = np.zeros(T.shape)
+    for g, m_eV, s, fermion in zip(
+        species_soa["g"], species_soa["mass_eV"],
+        species_soa["spin"], species_soa["fermion"],
+    ):
+        mu = m_eV / (k_B_eV_per_K * T) if m_eV > 0.0 else np.zeros(T.shape)
+        massive = mu > _MU_FLOOR
+
+        contrib = np.empty(T.shape)
+        if not massive.all():
+            contrib[~massive] = _massless_integral(n_x, s, fermion)
+        if massive.any():
+            mu_m = mu[massive]
+            X = mu_m.astype(dtype)[:, None] + t
+            integrand = _kernel(X, s)
+            integrand *= _occupation(X, fermion)
+            contrib[massive] = np.exp(-mu_m) * (integrand @ w).astype(np.float64)
+        total += g * contrib
+    return total
+
+
+# F(T) is memoized on log10(T) rounded to this step, i.e. temperatures
+# within ~1e-4 relative of each other share one quadrature (and one value).
+_F_LOG10_STEP = 1e-4
+
+
+@lru_cache(maxsize=4096)
+def _F_cached(key: int, n_x: int, version: int) -> float:
+    return I_of_T(10.0 ** (key * _F_LOG10_STEP), n_x=n_x)
+
+
+def F_of_T(T: float, n_x: int = _N_NODES) -> float:
+    """Effective spectral efficiency F(T).
 
     Overall geometric and numerical prefactors are absorbed into the
     units of time; what matters for the evaporation law is the
     relative variation of F(T) along the trajectory.
-    \"\"\"
-    return I_of_T(T, n_x=n_x)
+
+    Values are memoized on log10(T) quantized to 1e-4 and on the
+    particle-content version (see :func:`greybody.set_species`). The
+    quantization moves T by up to ~1.2e-4 relative, so results can differ
+    from :func:`I_of_T` by ~1e-4 relative, far more than the quadrature
+    error; use :func:`F_of_T_batch` where exact values matter.
+    ``n_x`` is the number of Gauss–Laguerre nodes, as in :func:`I_of_T`.
+    """
+    key = int(round(math.log10(T) / _F_LOG10_STEP))
+    return _F_cached(key, n_x, species_version())
+
+
+def F_of_T_batch(
+    T: np.ndarray, n_x: int = _N_NODES, dtype: np.dtype = np.float64
+) -> np.ndarray:
+    """F(T) for an array of temperatures in one batched quadrature.
+
+    Unlike :func:`F_of_T` the values are exact (not quantized) and not
+    memoized; use this when F is needed at many temperatures at once.
+    ``n_x`` is the number of Gauss–Laguerre nodes, as in :func:`I_of_T`.
+
+    With ``dtype=np.float32`` the integrand matrices of the massive
+    species are built in single precision, which halves their memory
+    traffic for large batches at a relative error of a few 1e-7. The
+    result is always float64.
+    """
+    T = np.asarray(T, dtype=float)
+    return _I_of_T_batch(T.ravel(), n_x=n_x, dtype=dtype).reshape(T.shape)
 
 
 def normalized_efficiency(T_grid: np.ndarray, T0: float) -> Tuple[np.ndarray, np.ndarray]:
-    \"\"\"Return F(T)/F(T0) on a grid.
+    """Return F(T)/F(T0) on a grid.
 
     Parameters
     ----------
@@ -99,8 +256,8 @@ def normalized_efficiency(T_grid: np.ndarray, T0: float) -> Tuple[np.ndarray, np
         Same as input, cast to float.
     F_norm : ndarray
         Normalised efficiency F(T)/F(T0).
-    \"\"\"
+    """
     T_grid = np.asarray(T_grid, dtype=float)
-    F_vals = np.array([F_of_T(T) for T in T_grid])
-    F0 = F_of_T(T0)
+    F_all = F_of_T_batch(np.append(T_grid.ravel(), T0))
+    F_vals, F0 = F_all[:-1].reshape(T_grid.shape), F_all[-1]
     return T_grid, F_vals / F0
@@ -18,10 +18,13 @@ def main() -> None:
     p.add_argument("--M0", type=float, default=1.0)
     p.add_argument("--T0", type=float, default=1.227e12)
     p.add_argument("--n-steps", type=int, default=8000)
+    p.add_argument("--method", choices=["dop853", "euler", "euler-batch"], default="dop853")
     p.add_argument("--output", type=str, default="fullsim_trajectory.csv")
     args = p.parse_args()
 
-    params = FullSimParams(M0=args.M0, T0=args.T0, n_steps=args.n_steps)
+    params = FullSimParams(
+        M0=args.M0, T0=args.T0, n_steps=args.n_steps, method=args.method
+    )
     out_path = Path(args.output)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
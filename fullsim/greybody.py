@@ -1,5 +1,5 @@
 
-\"\"\"Greybody factors and particle content for the full F(T) model.
+"""Greybody factors and particle content for the full F(T) model.
 
 We follow the prescription summarized in the original full-simulation
 report ``Ordo Vacui -- Повний симулятор F(T)``:
@@ -34,12 +34,12 @@ The particle content is taken to be
     π        (s=0,   g=3, m=139.6 MeV),
 
 matching the species listed on the first page of the full F(T) report.fileciteturn0file1
-\"\"\"
+"""
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Sequence
 
 import numpy as np
 
@@ -70,13 +70,69 @@ species_set: List[Species] = [
 ]
 
 
+def species_arrays(species: Sequence[Species]) -> Dict[str, np.ndarray]:
+    """Structure-of-arrays view of a particle content.
+
+    Returns a dict of parallel arrays ``g``, ``mass_eV``, ``spin`` and
+    ``fermion`` (bool), one entry per species, so that sums over species
+    can be written as array operations.
+    """
+    return {
+        "g": np.array([sp.g for sp in species], dtype=float),
+        "mass_eV": np.array([sp.mass_eV for sp in species], dtype=float),
+        "spin": np.array([sp.spin for sp in species], dtype=float),
+        "fermion": np.array([sp.fermion for sp in species], dtype=bool),
+    }
+
+
+def _species_snapshot(species: Sequence[Species]):
+    return tuple((sp.g, sp.mass_eV, sp.spin, sp.fermion) for sp in species)
+
+
+# Array view of ``species_set`` used by the spectral integral. It is kept
+# in sync by species_version(), which the integrals call before reading it,
+# so direct edits of species_set (or of its entries) are picked up too.
+species_soa: Dict[str, np.ndarray] = species_arrays(species_set)
+_species_seen = _species_snapshot(species_set)
+_species_version = 0
+
+
+def set_species(species: Sequence[Species]) -> None:
+    """Replace the particle content used by the full simulation.
+
+    Updates ``species_set`` in place; ``species_soa`` and memoized F(T)
+    values follow on the next :func:`species_version` call.
+    """
+    species_set[:] = list(species)
+    species_version()
+
+
+def species_version() -> int:
+    """Version of the particle content, bumped whenever it changes.
+
+    Compares ``species_set`` with the content last seen; on a change
+    (through :func:`set_species` or by editing the list or its entries
+    directly) ``species_soa`` is rebuilt in place and the version is
+    incremented, which invalidates memoized F(T) values.
+    """
+    global _species_seen, _species_version
+    snapshot = _species_snapshot(species_set)
+    if snapshot != _species_seen:
+        species_soa.update(species_arrays(species_set))
+        _species_seen = snapshot
+        _species_version += 1
+    return _species_version
+
+
 def chi_s_y(y: np.ndarray, s: float) -> np.ndarray:
-    \"\"\"Spin-dependent greybody factor χ_s(y).
+    """Spin-dependent greybody factor χ_s(y).
 
     Parameters
     ----------
     y : array_like
         Dimensionless frequency y = x / (4π), where x=ℏω/(k_B T).
+        float32 arrays are evaluated in float32; anything else is
+        converted to float64.
     s : float
         Spin of the field (0, 1/2, 1, 2).
 
@@ -85,23 +141,25 @@ def chi_s_y(y: np.ndarray, s: float) -> np.ndarray:
     χ_s(y) : ndarray
         Dimensionless absorption factor, normalized such that for
         y→∞ it approaches 27π/4 for all spins.
-    \"\"\"
-    y = np.asarray(y, dtype=float)
+    """
+    y = np.asarray(y)
+    if y.dtype != np.float32:
+        y = y.astype(float, copy=False)
     high = 27.0 * np.pi / 4.0
+    y2 = y * y
 
     if abs(s) < 1e-9:
         low = 4.0 * np.pi
-        return low + (high - low) * (y**2 / (1.0 + y**2))
-
-    # For s=1/2,1,2 we choose exponents that reproduce the expected
-    # low-frequency scaling.
-    if abs(s - 0.5) < 1e-9:
-        p = 2.0
-    elif abs(s - 1.0) < 1e-9:
-        p = 4.0
+        return low + (high - low) * (y2 / (1.0 + y2))
+
+    # For s=1/2,1,2 we choose exponents 2,4,6 that reproduce the expected
+    # low-frequency scaling. They are even integers, so y^p is built from
+    # y^2 by multiplication instead of a floating-point power.
+    if abs(s - 1.0) < 1e-9:
+        yp = y2 * y2
     elif abs(s - 2.0) < 1e-9:
-        p = 6.0
-    else:
-        p = 2.0
+        yp = y2 * y2 * y2
+    else:  # s = 1/2 and any other spin
+        yp = y2
 
-    return high * (y**p / (1.0 + y**p))
+    return high * (yp / (1.0 + yp))
@@ -5,7 +5,14 @@ This package exposes a small, composable API for toy black-hole evaporation,
 bit accounting, and generalized-entropy scans inspired by the HOLE framework.
 """
 
-from .evap import EvapParams, lifetime, mass_of_t, temperature_of_t, area_of_t
+from .evap import (
+    EvapParams,
+    lifetime,
+    mass_of_t,
+    time_of_mass,
+    temperature_of_t,
+    area_of_t,
+)
 from .bits import B_bh_bits, B_rad_bits, B_acc_bits
 from .chaos import ChaosParams, lyapunov_of_t
 from .sgen import (
@@ -14,6 +21,9 @@ from .sgen import (
     s_rad_of_t,
     s_gen_of_t,
     qes_branches,
+    s_bh_from_mass,
+    s_rad_from_mass,
+    qes_branches_from_mass,
     find_page_time,
     find_qes_switch_time,
 )
@@ -24,6 +34,7 @@ from .config import (
     load_config,
     build_params_from_config,
     run_from_config,
+    run_many_from_configs,
 )
 
 __all__ = [
@@ -32,6 +43,7 @@ __all__ = [
     "SGenParams",
     "lifetime",
     "mass_of_t",
+    "time_of_mass",
     "temperature_of_t",
     "area_of_t",
     "B_bh_bits",
@@ -42,6 +54,9 @@ __all__ = [
     "s_rad_of_t",
     "s_gen_of_t",
     "qes_branches",
+    "s_bh_from_mass",
+    "s_rad_from_mass",
+    "qes_branches_from_mass",
     "find_page_time",
     "find_qes_switch_time",
     "compute_thresholds",
@@ -50,6 +65,7 @@ __all__ = [
     "load_config",
     "build_params_from_config",
     "run_from_config",
+    "run_many_from_configs",
 ]
 
 __version__ = "0.1.0"
@@ -0,0 +1,127 @@
+"""Fused single-pass kernel for :func:`hole.pipeline.compute_thresholds`.
+
+The NumPy pipeline builds each grid (M, bit budgets, entropies) in its own
+array pass. Here a single loop over t fills all of them and tracks the
+Page, Hayden–Preskill and QES crossing indices as it goes. The kernel is
+opt-in (``compute_thresholds(..., compiled=True)``) and needs numba; the
+NumPy implementation is the default.
+
+Visibility profiles are passed as a kind code plus a parameter tuple so
+that χ(M) is evaluated inside the compiled loop instead of calling back
+into Python. Profiles built by :func:`hole.config.chi_from_visibility_config`
+carry this description in a ``_chi_spec`` attribute.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; the pipeline falls back to NumPy
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# χ(M) kinds understood by the kernel, with parameter tuples
+#   CHI_CONSTANT: (chi0,)
+#   CHI_POWERLAW: (chi0, M_ref, p)
+#   CHI_STEP:     (chi_hi, chi_lo, M_step)
+CHI_CONSTANT = 0
+CHI_POWERLAW = 1
+CHI_STEP = 2
+
+_C_BH = 4.0 * math.pi / math.log(2.0)
+_C_ACC = 8.0 * math.pi / math.log(2.0)
+
+
+@njit(cache=True)
+def _chi(M, chi_kind, chi_params):
+    if chi_kind == CHI_CONSTANT:
+        return chi_params[0]
+    if chi_kind == CHI_POWERLAW:
+        return chi_params[0] * (M / chi_params[1]) ** chi_params[2]
+    return chi_params[0] if M >= chi_params[2] else chi_params[1]
+
+
+@njit(cache=True)
+def _pipeline_kernel(u, M0, M0_bits, kappa, chi_kind, chi_params):
+    """Fill all pipeline grids in one pass over the time grid.
+
+    ``u = t / t_evap`` is the unit time grid, so the evaporation law is
+    M = M0 (1 - u)^(1/3); ``M0_bits`` is the reference mass in B_rad.
+    Returns the grids M, B_bh, B_rad, B_acc, S_bh, S_rad, S_gen, S_no,
+    S_island, followed by the index of the entropy Page point, the first
+    HP index (-1 if none) and the index i of the first QES switch between
+    t[i] and t[i+1] (-1 if none).
+    """
+    n = u.shape[0]
+    M = np.empty(n)
+    B_bh = np.empty(n)
+    B_rad = np.empty(n)
+    B_acc = np.empty(n)
+    S_bh = np.empty(n)
+    S_rad = np.empty(n)
+    S_gen = np.empty(n)
+    S_no = np.empty(n)
+    S_island = np.empty(n)
+
+    M0_bits_sq = M0_bits * M0_bits
+    M0_sq = M0 * M0
+
+    i_page = 0
+    d_page = math.inf
+    i_hp = -1
+    i_qes = -1
+
+    I = 0.0
+    M_prev = 0.0
+    h_prev = 0.0
+    nonneg_prev = False
+    for i in range(n):
+        Mi = M0 * np.cbrt(1.0 - u[i])
+        M2 = Mi * Mi
+        M[i] = Mi
+
+        b_bh = _C_BH * M2
+        B_bh[i] = b_bh
+        B_rad[i] = _C_BH * (M0_bits_sq - M2)
+
+        h = _chi(Mi, chi_kind, chi_params) * Mi
+        if i > 0:
+            I += 0.5 * (h_prev + h) * (M_prev - Mi)
+        B_acc[i] = _C_ACC * I
+        M_prev = Mi
+        h_prev = h
+
+        s_rad = _C_BH * (M0_sq - M2)
+        s_island = b_bh + kappa * s_rad
+        S_bh[i] = b_bh
+        S_rad[i] = s_rad
+        S_no[i] = s_rad
+        S_island[i] = s_island
+        S_gen[i] = min(s_rad, s_island)
+
+        d = abs(b_bh - s_rad)
+        if d < d_page:
+            d_page = d
+            i_page = i
+
+        if i_hp < 0 and B_acc[i] - b_bh >= 0.0:
+            i_hp = i
+
+        nonneg = s_rad - s_island >= 0.0
+        if i_qes < 0 and i > 0 and nonneg != nonneg_prev:
+            i_qes = i - 1
+        nonneg_prev = nonneg
+
+    return (
+        M, B_bh, B_rad, B_acc, S_bh, S_rad, S_gen, S_no, S_island,
+        i_page, i_hp, i_qes,
+    )
@@ -28,6 +28,17 @@ def B_rad_bits(M: ArrayLike, M0: float):
     return (4.0 * math.pi / LOG2) * (M0**2 - M_arr**2)
 
 
+def _chi_on_grid(chi_func, M: np.ndarray) -> np.ndarray:
+    """Evaluate χ on the grid M, vectorized when chi_func allows it."""
+    try:
+        chi = np.asarray(chi_func(M), dtype=float)
+    except (TypeError, ValueError):
+        chi = None
+    if chi is None or chi.shape not in ((), M.shape):
+        chi = np.vectorize(chi_func, otypes=[float])(M)
+    return chi
+
+
 def B_acc_bits(M_array, M0: float, chi_func=lambda M: 1.0):
     """Accessible bits with a visibility profile χ(M).
 
@@ -38,6 +49,11 @@ def B_acc_bits(M_array, M0: float, chi_func=lambda M: 1.0):
     on a grid M_array that is assumed to be monotonically decreasing
     from M0 to a final mass. The returned array has B_acc(M0) = 0 and
     grows as M decreases.
+
+    The integral is accumulated with a cumulative trapezoid rule.
+    ``chi_func`` is called once on the whole grid and should return an
+    array of the same shape (or a scalar). Profiles that only accept
+    scalar masses are detected and evaluated pointwise instead.
     """
     M = np.asarray(M_array, dtype=float)
     if M[0] < M[-1]:
@@ -45,11 +61,10 @@ def B_acc_bits(M_array, M0: float, chi_func=lambda M: 1.0):
             "M_array is expected to be monotonically decreasing from M0."
         )
 
-    h = np.array([chi_func(m) * m for m in M], dtype=float)
+    h = _chi_on_grid(chi_func, M) * M
 
-    I = np.zeros_like(M)
-    for i in range(1, len(M)):
-        dM = M[i - 1] - M[i]  # > 0
-        I[i] = I[i - 1] + 0.5 * (h[i - 1] + h[i]) * dM
+    dM = -np.diff(M)  # > 0
+    seg = 0.5 * (h[:-1] + h[1:]) * dM
+    I = np.concatenate(([0.0], np.cumsum(seg)))
 
     return (8.0 * math.pi / LOG2) * I
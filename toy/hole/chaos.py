@@ -6,13 +6,13 @@ from typing import Union
 
 import numpy as np
 
-from .evap import EvapParams, temperature_of_t
+from .evap import EvapParams, temperature_of_t, _DATACLASS_SLOTS
 
 
 ArrayLike = Union[float, "np.ndarray"]
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ChaosParams:
     """Parameters controlling scrambling and Lyapunov exponents.
 
@@ -34,11 +34,10 @@ class ChaosParams:
 def lyapunov_of_t(t: ArrayLike, evap: EvapParams, chaos: ChaosParams):
     """Toy Lyapunov exponent λ_L(t) from T_H(t) and α_scr.
 
-    λ_L(t) = (2π / β_H(t)) / α_scr with β_H=1/T_H.
+    λ_L(t) = (2π / β_H(t)) / α_scr with β_H=1/T_H, i.e. 2π T_H / α_scr.
     """
     import math
 
     t_arr = np.asarray(t, dtype=float)
     T_H = temperature_of_t(t_arr, evap)
-    beta_H = 1.0 / (T_H + 1e-16)
-    return (2.0 * math.pi / beta_H) / chaos.alpha_scr
+    return (2.0 * math.pi * T_H) / chaos.alpha_scr
@@ -14,15 +14,57 @@ files.
 
 from __future__ import annotations
 
+import hashlib
+import importlib
+import itertools
 import json
-from dataclasses import asdict
+import math
+import mmap
+import os
+import pickle
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Dict, Any, Tuple, Union
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json
+    orjson = None
+else:
+    _ORJSON_DUMP_OPTS = (
+        orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+try:
+    import diskcache
+except ImportError:  # diskcache is optional; cached results then stay in memory
+    diskcache = None
 
 from .evap import EvapParams
 from .chaos import ChaosParams
 from .sgen import SGenParams
 from .pipeline import compute_thresholds
+from ._kernel import CHI_CONSTANT, CHI_POWERLAW, CHI_STEP
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls) -> Tuple[str, ...]:
+    """Field names of a dataclass type, looked up once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _fast_asdict(obj) -> Dict[str, Any]:
+    """Shallow ``dataclasses.asdict`` for the flat parameter classes.
+
+    The parameter dataclasses hold only scalars and strings, so the
+    recursive copy done by ``asdict`` is not needed.
+    """
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
 
 
 def default_config(M0: float = 1.0) -> Dict[str, Any]:
@@ -46,23 +88,113 @@ def default_config(M0: float = 1.0) -> Dict[str, Any]:
     }
 
 
+def _all_finite(obj: Any) -> bool:
+    """False if ``obj`` contains a NaN or infinite float anywhere."""
+    if isinstance(obj, dict):
+        return all(_all_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return all(_all_finite(v) for v in obj)
+    if isinstance(obj, (float, np.floating)):
+        return math.isfinite(obj)
+    if isinstance(obj, np.ndarray) and obj.dtype.kind in "fc":
+        return bool(np.isfinite(obj).all())
+    return True
+
+
 def save_config(cfg: Dict[str, Any], path: Union[str, Path]) -> None:
-    """Save a configuration dictionary to a JSON file."""
+    """Save a configuration dictionary to a JSON file.
+
+    Uses orjson when it is installed and the stdlib json otherwise; both
+    write sorted keys with a two-space indent. Configurations orjson
+    cannot represent faithfully (NaN or infinite values, which it would
+    write as ``null``) or cannot serialize at all go through the stdlib
+    json, which writes ``NaN``/``Infinity``.
+    """
     path = Path(path)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2, sort_keys=True)
+    data = None
+    if orjson is not None and _all_finite(cfg):
+        try:
+            data = orjson.dumps(cfg, option=_ORJSON_DUMP_OPTS)
+        except orjson.JSONEncodeError:
+            pass
+    if data is None:
+        data = json.dumps(cfg, indent=2, sort_keys=True).encode("utf-8")
+    path.write_bytes(data)
+
+
+# Files at least this large are memory-mapped by load_config when orjson
+# is available (it parses straight from the mapped buffer).
+_MMAP_MIN_BYTES = 1 << 20
 
 
 def load_config(path: Union[str, Path]) -> Dict[str, Any]:
-    """Load a configuration dictionary from a JSON file."""
+    """Load a configuration dictionary from a JSON file.
+
+    Large files (e.g. aggregated sweep dumps) are memory-mapped and parsed
+    in place when orjson is installed; the stdlib parser cannot read from
+    a mapping without copying it, so it always reads the file as bytes.
+    orjson rejects the ``NaN``/``Infinity`` literals the stdlib json
+    writes, so such files are handed to the stdlib parser.
+    """
     path = Path(path)
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    if orjson is not None and path.stat().st_size >= _MMAP_MIN_BYTES:
+        with path.open("rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mm) as buf:
+                try:
+                    return orjson.loads(buf)
+                except orjson.JSONDecodeError:
+                    pass
+            return json.loads(mm[:])
+
+    data = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _lit(x: float) -> str:
+    """Source literal for a float (repr round-trips exactly)."""
+    return repr(x) if math.isfinite(x) else f"float({str(x)!r})"
+
+
+@lru_cache(maxsize=None)
+def _compile_chi(name: str, body: str) -> Callable[[np.ndarray], np.ndarray]:
+    """Compile ``def name(M): return body`` with its constants inlined.
+
+    Profiles are generated from source so that their parameters are code
+    constants rather than closure cells or default arguments. Identical
+    profiles share one function object.
+    """
+    src = f"def {name}(M):\n    return {body}\n"
+    namespace = {"np": np}
+    exec(compile(src, f"<hole.config {name}>", "exec"), namespace)
+    return namespace[name]
 
 
-def chi_from_visibility_config(vis_cfg: Dict[str, Any]) -> Callable[[float], float]:
+def _constant_chi(chi0: float) -> Callable[[np.ndarray], np.ndarray]:
+    """χ(M) = chi0, tagged for the compiled kernel."""
+    chi_const = _compile_chi(
+        "chi_const", f"np.full_like(np.asarray(M, dtype=float), {_lit(chi0)})"
+    )
+    chi_const._chi_spec = (CHI_CONSTANT, (chi0,))
+    return chi_const
+
+
+def chi_from_visibility_config(
+    vis_cfg: Dict[str, Any]
+) -> Callable[[np.ndarray], np.ndarray]:
     """Construct a visibility profile χ(M) from a config dict.
 
+    The returned function is vectorized: it accepts a scalar or an array
+    of masses and returns an array of the same shape.
+
     Supported forms:
 
     - type: "constant"
@@ -76,25 +208,32 @@ def chi_from_visibility_config(vis_cfg: Dict[str, Any]) -> Callable[[float], flo
              = chi_lo for M <  M_step
 
     Additional forms can be added without touching the rest of the code.
+    The returned function carries its kind and parameters in a
+    ``_chi_spec`` attribute, which lets :func:`compute_thresholds`
+    evaluate it inside the compiled kernel.
     """
     vtype = vis_cfg.get("type", "constant")
 
     if vtype == "constant":
         chi0 = float(vis_cfg.get("chi0", 1.0))
-
-        def chi_const(M: float, _c=chi0) -> float:
-            return _c
-
-        return chi_const
+        return _constant_chi(chi0)
 
     if vtype == "powerlaw":
         chi0 = float(vis_cfg.get("chi0", 1.0))
         M_ref = float(vis_cfg.get("M_ref", 1.0))
         p = float(vis_cfg.get("p", 0.0))
 
-        def chi_powerlaw(M: float, _c=chi0, _mr=M_ref, _p=p) -> float:
-            return _c * (M / _mr) ** _p
-
+        if p == 0.0:
+            return _constant_chi(chi0)
+        if p == 1.0:
+            body = f"{_lit(chi0)} * (np.asarray(M, dtype=float) / {_lit(M_ref)})"
+        else:
+            body = (
+                f"{_lit(chi0)} * np.power("
+                f"np.asarray(M, dtype=float) / {_lit(M_ref)}, {_lit(p)})"
+            )
+        chi_powerlaw = _compile_chi("chi_powerlaw", body)
+        chi_powerlaw._chi_spec = (CHI_POWERLAW, (chi0, M_ref, p))
         return chi_powerlaw
 
     if vtype == "step":
@@ -102,9 +241,12 @@ def chi_from_visibility_config(vis_cfg: Dict[str, Any]) -> Callable[[float], flo
         chi_lo = float(vis_cfg.get("chi_lo", 0.0))
         M_step = float(vis_cfg.get("M_step", 0.5))
 
-        def chi_step(M: float, _hi=chi_hi, _lo=chi_lo, _ms=M_step) -> float:
-            return _hi if M >= _ms else _lo
-
+        body = (
+            f"np.where(np.asarray(M, dtype=float) >= {_lit(M_step)}, "
+            f"{_lit(chi_hi)}, {_lit(chi_lo)})"
+        )
+        chi_step = _compile_chi("chi_step", body)
+        chi_step._chi_spec = (CHI_STEP, (chi_hi, chi_lo, M_step))
         return chi_step
 
     raise ValueError(f"Unsupported visibility type: {vtype!r}")
@@ -112,7 +254,7 @@ def chi_from_visibility_config(vis_cfg: Dict[str, Any]) -> Callable[[float], flo
 
 def build_params_from_config(
     cfg: Dict[str, Any]
-) -> Tuple[EvapParams, ChaosParams, SGenParams, Callable[[float], float]]:
+) -> Tuple[EvapParams, ChaosParams, SGenParams, Callable[[np.ndarray], np.ndarray]]:
     """Build parameter objects and χ(M) from a configuration dictionary."""
     evap_cfg = cfg.get("evap", {})
     chaos_cfg = cfg.get("chaos", {})
@@ -127,21 +269,114 @@ def build_params_from_config(
     return evap, chaos, sgen, chi_func
 
 
+# Layout version of a result-cache entry (a pickled result dict). Changes
+# to the computation itself are covered by _code_fingerprint().
+_RESULT_CACHE_TAG = b"hole-toy/results/1"
+
+# Modules whose code determines the output of run_from_config.
+_FINGERPRINT_MODULES = (
+    "evap", "bits", "chaos", "sgen", "pipeline", "_kernel", "config",
+)
+_MEMORY_CACHE_SIZE = 128
+_result_store = None
+
+
+class _MemoryCache:
+    """Small LRU mapping used when diskcache is not installed."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key, default=None):
+        if key not in self._data:
+            return default
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def __setitem__(self, key, value) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+def _result_cache():
+    """The result store: a diskcache.Cache, or an in-memory LRU fallback.
+
+    The on-disk location is ``$HOLE_CACHE_DIR`` (default
+    ``~/.cache/hole-toy``).
+    """
+    global _result_store
+    if _result_store is None:
+        if diskcache is not None:
+            directory = os.environ.get(
+                "HOLE_CACHE_DIR", str(Path.home() / ".cache" / "hole-toy")
+            )
+            _result_store = diskcache.Cache(directory)
+        else:
+            _result_store = _MemoryCache(_MEMORY_CACHE_SIZE)
+    return _result_store
+
+
+@lru_cache(maxsize=None)
+def _code_fingerprint() -> bytes:
+    """Digest of the package and NumPy versions and the pipeline sources.
+
+    Part of every result-cache key, so that upgrading or editing the code
+    never serves results computed by an older version.
+    """
+    from . import __version__
+
+    h = hashlib.blake2b(f"{__version__}|{np.__version__}".encode("utf-8"))
+    for name in _FINGERPRINT_MODULES:
+        module = importlib.import_module(f"{__package__}.{name}")
+        h.update(name.encode("utf-8"))
+        h.update(Path(module.__file__).read_bytes())
+    return h.digest()
+
+
+def _result_key(cfg: Dict[str, Any], n_steps: int) -> str:
+    """Hash of the code fingerprint, canonical JSON of cfg and n_steps."""
+    canonical = json.dumps(cfg, sort_keys=True, separators=(",", ":"))
+    h = hashlib.blake2b(_RESULT_CACHE_TAG)
+    h.update(_code_fingerprint())
+    h.update(canonical.encode("utf-8"))
+    h.update(int(n_steps).to_bytes(8, "little"))
+    return h.hexdigest()
+
+
 def run_from_config(
     cfg_or_path: Union[Dict[str, Any], str, Path],
     n_steps: int = 1000,
+    cache: bool = False,
 ) -> Dict[str, Any]:
     """Run the high-level pipeline from a configuration dict or JSON file.
 
     This is a thin convenience wrapper around :func:`compute_thresholds`
     that constructs the parameter objects and χ(M) from a JSON spec and
     returns the full result dictionary.
+
+    With ``cache=True`` results are memoized on the configuration content,
+    ``n_steps`` and a fingerprint of the package code and version: on disk
+    through diskcache when it is installed, otherwise in a small
+    per-process LRU. Each hit returns a fresh copy.
     """
     if isinstance(cfg_or_path, (str, Path)):
         cfg = load_config(cfg_or_path)
     else:
         cfg = cfg_or_path
 
+    if cache:
+        key = _result_key(cfg, n_steps)
+        store = _result_cache()
+        blob = store.get(key)
+        if blob is not None:
+            return pickle.loads(blob)
+        result = run_from_config(cfg, n_steps=n_steps)
+        store[key] = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        return result
+
     evap, chaos, sgen, chi_func = build_params_from_config(cfg)
 
     result = compute_thresholds(
@@ -153,8 +388,59 @@ def run_from_config(
         n_steps=n_steps,
     )
     result["config"] = {
-        "evap": asdict(evap),
-        "chaos": asdict(chaos),
-        "sgen": asdict(sgen),
+        "evap": _fast_asdict(evap),
+        "chaos": _fast_asdict(chaos),
+        "sgen": _fast_asdict(sgen),
     }
     return result
+
+
+def run_many_from_configs(
+    cfgs: Iterable[Union[Dict[str, Any], str, Path]],
+    n_steps: int = 1000,
+    workers: Optional[int] = None,
+    cache: bool = False,
+) -> List[Dict[str, Any]]:
+    """Run :func:`run_from_config` for many universes in parallel.
+
+    Each configuration (dict or JSON path) is independent, so the runs
+    are spread over a ``ProcessPoolExecutor`` with ``workers`` processes
+    (default: one per CPU). Results are returned in input order.
+
+    With ``cache=True`` the result cache is consulted in this process
+    before dispatching, and identical configurations are computed only
+    once; fresh results are added to the cache.
+    """
+    cfgs = [load_config(c) if isinstance(c, (str, Path)) else c for c in cfgs]
+    workers = workers or os.cpu_count() or 1
+
+    if cache:
+        store = _result_cache()
+        keys = [_result_key(cfg, n_steps) for cfg in cfgs]
+        blobs = {key: store.get(key) for key in keys}
+        todo = {key: cfg for key, cfg in zip(keys, cfgs) if blobs[key] is None}
+    else:
+        todo = dict(enumerate(cfgs))
+
+    if workers == 1 or len(todo) <= 1:
+        fresh = [run_from_config(cfg, n_steps=n_steps) for cfg in todo.values()]
+    else:
+        chunksize = max(1, len(todo) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            fresh = list(
+                executor.map(
+                    run_from_config,
+                    todo.values(),
+                    itertools.repeat(n_steps),
+                    chunksize=chunksize,
+                )
+            )
+
+    if not cache:
+        return fresh
+
+    for key, result in zip(todo, fresh):
+        blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        store[key] = blob
+        blobs[key] = blob
+    return [pickle.loads(blobs[key]) for key in keys]
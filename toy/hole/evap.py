@@ -15,6 +15,7 @@ implementation, this module would be replaced by a quadrature over
 greybody factors and particle content.
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Union
 
@@ -24,8 +25,15 @@ import math
 
 ArrayLike = Union[float, "np.ndarray"]
 
+_INV_8PI = 1.0 / (8.0 * math.pi)
+_16PI = 16.0 * math.pi
 
-@dataclass
+# The parameter dataclasses use __slots__ where dataclass supports it
+# (Python >= 3.10); on 3.9 they fall back to regular instances.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class EvapParams:
     """Parameters for the toy evaporation law.
 
@@ -63,21 +71,41 @@ def mass_of_t(t: ArrayLike, params: EvapParams):
 
         M(t)^3 = M0^3 - 3 k t
 
-    and clip at M=0 for numerical safety.
+    and clip at M=0 for numerical safety. Python scalars take a plain
+    float path and return a float.
     """
-    t_arr = np.asarray(t, dtype=float)
     M0, k = params.M0, params.k_hawk
+    if isinstance(t, (int, float)):
+        inside = max(M0**3 - 3.0 * k * t, 0.0)
+        return inside ** (1.0 / 3.0)
+
+    t_arr = np.asarray(t, dtype=float)
     inside = np.maximum(M0**3 - 3.0 * k * t_arr, 0.0)
-    return inside ** (1.0 / 3.0)
+    return np.cbrt(inside)
+
+
+def time_of_mass(M: ArrayLike, params: EvapParams):
+    """Inverse of :func:`mass_of_t`: the time t at which M(t) = M.
+
+    t = (M0^3 - M^3) / (3 k), clipped to [0, t_evap].
+    """
+    M_arr = np.asarray(M, dtype=float)
+    M0, k = params.M0, params.k_hawk
+    t = (M0**3 - M_arr**3) / (3.0 * k)
+    return np.clip(t, 0.0, lifetime(params))
 
 
 def temperature_of_t(t: ArrayLike, params: EvapParams):
     """Hawking temperature T_H(t) (toy 4D Schwarzschild).
 
-    In Planck units, T_H = 1 / (8π M).
+    In Planck units, T_H = 1 / (8π M), which is +inf once the hole has
+    evaporated (M = 0).
     """
     M = mass_of_t(t, params)
-    return 1.0 / (8.0 * math.pi * (M + 1e-16))
+    if isinstance(M, float):
+        return _INV_8PI / M if M > 0.0 else math.inf
+    with np.errstate(divide="ignore"):
+        return _INV_8PI / M
 
 
 def area_of_t(t: ArrayLike, params: EvapParams):
@@ -86,4 +114,4 @@ def area_of_t(t: ArrayLike, params: EvapParams):
     In Planck units, A = 16π M^2.
     """
     M = mass_of_t(t, params)
-    return 16.0 * math.pi * M**2
+    return _16PI * (M * M)
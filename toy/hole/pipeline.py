@@ -12,18 +12,22 @@ from typing import Callable, Optional, Dict, Any
 
 import numpy as np
 
-from .evap import EvapParams, lifetime, mass_of_t
+from .evap import EvapParams, lifetime, time_of_mass
 from .bits import B_bh_bits, B_rad_bits, B_acc_bits
 from .chaos import ChaosParams
 from .sgen import (
     SGenParams,
-    s_bh_of_t,
-    s_rad_of_t,
-    s_gen_of_t,
-    qes_branches,
+    s_bh_from_mass,
+    s_rad_from_mass,
+    qes_branches_from_mass,
     find_page_time,
     find_qes_switch_time,
+    _interp_switch,
 )
+from ._kernel import HAVE_NUMBA, _pipeline_kernel
+
+
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
 
 
 def compute_thresholds(
@@ -33,6 +37,7 @@ def compute_thresholds(
     chaos_params: Optional[ChaosParams] = None,
     sgen_params: Optional[SGenParams] = None,
     n_steps: int = 1000,
+    compiled: bool = False,
 ) -> Dict[str, Any]:
     """High-level HOLE-style toy pipeline.
 
@@ -61,56 +66,64 @@ def compute_thresholds(
         A dictionary containing time and mass grids, bit budgets, Page-point
         estimates, and toy QES-like transition times. See README for a
         summary of the keys.
+
+    With ``compiled=True``, when numba is installed and ``chi_func``
+    carries a ``_chi_spec`` description (as the profiles from
+    :mod:`hole.config` do), all grids and crossing indices are computed
+    in one compiled pass. By default the NumPy implementation below is
+    used; with the vectorized config profiles it is as fast as the
+    compiled pass or faster.
     """
     evap = evap_params or EvapParams(M0=M0)
     chaos = chaos_params or ChaosParams()
     sparams = sgen_params or SGenParams()
 
-    # Time and mass grids
+    # Time and mass grids. With u = t / t_evap the evaporation law is
+    # M = M0 (1 - u)^(1/3), which needs no clipping since 1 - u >= 0.
     t_evap = lifetime(evap)
-    t = np.linspace(0.0, t_evap, n_steps)
-    M = mass_of_t(t, evap)
-
-    # Bit budgets
-    B_bh = B_bh_bits(M)
-    B_rad = B_rad_bits(M, M0)
-    B_acc = B_acc_bits(M, M0, chi_func)
+    u = np.linspace(0.0, 1.0, n_steps)
+    t = t_evap * u
+
+    chi_spec = getattr(chi_func, "_chi_spec", None)
+    if compiled and HAVE_NUMBA and chi_spec is not None:
+        chi_kind, chi_args = chi_spec
+        (
+            M, B_bh, B_rad, B_acc, S_bh, S_rad, S_gen, S_no, S_island,
+            i_page, i_hp, i_qes,
+        ) = _pipeline_kernel(
+            u, evap.M0, M0, sparams.kappa,
+            chi_kind, np.asarray(chi_args, dtype=float),
+        )
+        t_page_qes, S_page_val = float(t[i_page]), float(S_bh[i_page])
+        t_hp = float(t[i_hp]) if i_hp >= 0 else math.nan
+        if i_qes >= 0:
+            t_qes_switch = _interp_switch(
+                t[i_qes], t[i_qes + 1],
+                S_no[i_qes] - S_island[i_qes],
+                S_no[i_qes + 1] - S_island[i_qes + 1],
+            )
+        else:
+            t_qes_switch = math.nan
+    else:
+        M = evap.M0 * np.cbrt(1.0 - u)
+        (
+            M, B_bh, B_rad, B_acc, S_bh, S_rad, S_gen, S_no, S_island,
+            t_page_qes, S_page_val, t_hp, t_qes_switch,
+        ) = _grids_numpy(t, M, M0, chi_func, evap, sparams)
 
     # Geometric Page mass/time
-    M_page_geom = M0 / math.sqrt(2.0)
-    t_page_geom = float(np.interp(M_page_geom, M[::-1], t[::-1]))
+    M_page_geom = M0 * _INV_SQRT2
+    t_page_geom = float(time_of_mass(M_page_geom, evap))
 
     # Operational Page mass/time from B_acc = 1/2 B_BH(M0)
     B_half = 0.5 * B_bh_bits(M0)
     if B_acc[-1] >= B_half:
         M_page_op = float(np.interp(B_half, B_acc, M))
-        t_page_op = float(np.interp(M_page_op, M[::-1], t[::-1]))
+        t_page_op = float(time_of_mass(M_page_op, evap))
     else:
         M_page_op = math.nan
         t_page_op = math.nan
 
-    # Toy BH and radiation entropies
-    S_bh = s_bh_of_t(t, evap, sparams)
-    S_rad = s_rad_of_t(t, evap, sparams)
-    S_gen = s_gen_of_t(t, evap, sparams)
-
-    # Page-like crossing in entropy picture
-    t_page_qes, S_page_val = find_page_time(t, S_bh, S_rad)
-
-    # Toy QES branches and switch
-    S_no, S_island = qes_branches(t, evap, sparams)
-    t_qes_switch = find_qes_switch_time(t, S_no, S_island)
-
-    # Toy Hayden–Preskill-like threshold:
-    # we take the first time when B_acc >= B_BH(M), i.e. when the
-    # accessible bit budget overtakes the remaining black-hole bits.
-    diff_hp = B_acc - B_bh
-    idx_hp = np.where(diff_hp >= 0.0)[0]
-    if len(idx_hp) > 0:
-        t_hp = float(t[int(idx_hp[0])])
-    else:
-        t_hp = math.nan
-
     return {
         "t": t,
         "M": M,
@@ -136,3 +149,43 @@ def compute_thresholds(
             "sgen": sparams,
         },
     }
+
+
+def _grids_numpy(t, M, M0, chi_func, evap, sparams):
+    """NumPy counterpart of :func:`hole._kernel._pipeline_kernel`.
+
+    Takes the time grid and its mass grid M = M(t). Returns the same grids
+    as the kernel (M included), followed by the entropy Page point
+    (t_page_qes, S_page_val), t_hp and t_qes_switch.
+    """
+    # Bit budgets
+    B_bh = B_bh_bits(M)
+    B_rad = B_rad_bits(M, M0)
+    B_acc = B_acc_bits(M, M0, chi_func)
+
+    # Toy BH and radiation entropies, on the mass grid M already computed
+    S_bh = s_bh_from_mass(M)
+    S_rad = s_rad_from_mass(M, evap.M0)
+
+    # Page-like crossing in entropy picture
+    t_page_qes, S_page_val = find_page_time(t, S_bh, S_rad)
+
+    # Toy QES branches, S_gen = min(S_no, S_island), and switch
+    S_no, S_island = qes_branches_from_mass(M, evap.M0, sparams.kappa)
+    S_gen = np.minimum(S_no, S_island)
+    t_qes_switch = find_qes_switch_time(t, S_no, S_island)
+
+    # Toy Hayden–Preskill-like threshold:
+    # we take the first time when B_acc >= B_BH(M), i.e. when the
+    # accessible bit budget overtakes the remaining black-hole bits.
+    # argmax returns the first True, or 0 if there is none.
+    idx_hp = int(np.argmax(B_acc >= B_bh))
+    if B_acc[idx_hp] >= B_bh[idx_hp]:
+        t_hp = float(t[idx_hp])
+    else:
+        t_hp = math.nan
+
+    return (
+        M, B_bh, B_rad, B_acc, S_bh, S_rad, S_gen, S_no, S_island,
+        t_page_qes, S_page_val, t_hp, t_qes_switch,
+    )
@@ -6,14 +6,14 @@ from typing import Union, Tuple
 
 import numpy as np
 
-from .evap import EvapParams, mass_of_t
+from .evap import EvapParams, mass_of_t, _DATACLASS_SLOTS
 from .bits import B_bh_bits, B_rad_bits
 
 
 ArrayLike = Union[float, "np.ndarray"]
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SGenParams:
     """Parameters for the toy generalized entropy.
 
@@ -40,14 +40,31 @@ class SGenParams:
 
 def s_bh_of_t(t: ArrayLike, evap: EvapParams, sparams: SGenParams):
     """Toy black-hole entropy S_BH(t) in 'bit units'."""
-    M = mass_of_t(t, evap)
-    return B_bh_bits(M)
+    return s_bh_from_mass(mass_of_t(t, evap))
 
 
 def s_rad_of_t(t: ArrayLike, evap: EvapParams, sparams: SGenParams):
     """Toy radiation entropy S_rad(t) in 'bit units'."""
-    M = mass_of_t(t, evap)
-    return B_rad_bits(M, evap.M0)
+    return s_rad_from_mass(mass_of_t(t, evap), evap.M0)
+
+
+def s_bh_from_mass(M: ArrayLike):
+    """Toy black-hole entropy S_BH on a precomputed mass grid M = M(t)."""
+    return B_bh_bits(M)
+
+
+def s_rad_from_mass(M: ArrayLike, M0: float):
+    """Toy radiation entropy S_rad on a precomputed mass grid M = M(t)."""
+    return B_rad_bits(M, M0)
+
+
+def qes_branches_from_mass(M: ArrayLike, M0: float, kappa: float):
+    """Toy QES branches S_no, S_island on a precomputed mass grid M = M(t)."""
+    S_bh = s_bh_from_mass(M)
+    S_rad = s_rad_from_mass(M, M0)
+    S_no = S_rad
+    S_island = S_bh + kappa * S_rad
+    return S_no, S_island
 
 
 def qes_branches(t: ArrayLike, evap: EvapParams, sparams: SGenParams):
@@ -56,11 +73,8 @@ def qes_branches(t: ArrayLike, evap: EvapParams, sparams: SGenParams):
     S_no(t)      = S_rad(t),
     S_island(t)  = S_BH(t) + κ S_rad(t).
     """
-    S_bh = s_bh_of_t(t, evap, sparams)
-    S_rad = s_rad_of_t(t, evap, sparams)
-    S_no = S_rad
-    S_island = S_bh + sparams.kappa * S_rad
-    return S_no, S_island
+    M = mass_of_t(t, evap)
+    return qes_branches_from_mass(M, evap.M0, sparams.kappa)
 
 
 def s_gen_of_t(t: ArrayLike, evap: EvapParams, sparams: SGenParams):
@@ -79,7 +93,8 @@ def find_page_time(t: ArrayLike, S_bh: ArrayLike, S_rad: ArrayLike):
     S_bh_arr = np.asarray(S_bh, dtype=float)
     S_rad_arr = np.asarray(S_rad, dtype=float)
 
-    diff = np.abs(S_bh_arr - S_rad_arr)
+    diff = S_bh_arr - S_rad_arr
+    np.abs(diff, out=diff)
     idx = int(np.argmin(diff))
     return float(t_arr[idx]), float(S_bh_arr[idx])
 
@@ -88,8 +103,9 @@ def find_qes_switch_time(t: ArrayLike, S_no: ArrayLike, S_island: ArrayLike):
     """Find first QES-like switch time from S_no to S_island.
 
     We look for the first sign change in ΔS(t) = S_no - S_island and
-    interpolate linearly between the bracketing points. Returns
-    NaN if no switch occurs.
+    interpolate linearly between the bracketing points. ΔS = 0 counts
+    as non-negative, so a switch is the first step where ΔS >= 0 flips.
+    Returns NaN if no switch occurs.
     """
     import math
 
@@ -98,16 +114,19 @@ def find_qes_switch_time(t: ArrayLike, S_no: ArrayLike, S_island: ArrayLike):
     S_island_arr = np.asarray(S_island, dtype=float)
 
     diff = S_no_arr - S_island_arr
-    sign = np.sign(diff)
-    idx = np.where(sign[:-1] * sign[1:] <= 0)[0]
+    nonneg = diff >= 0.0
+    flips = nonneg[:-1] ^ nonneg[1:]
 
-    if len(idx) == 0:
+    # argmax stops at the first True; an all-False scan returns 0.
+    i = int(np.argmax(flips)) if flips.size else 0
+    if flips.size == 0 or not flips[i]:
         return math.nan
 
-    i = int(idx[0])
-    t0, t1 = t_arr[i], t_arr[i + 1]
-    d0, d1 = diff[i], diff[i + 1]
+    return _interp_switch(t_arr[i], t_arr[i + 1], diff[i], diff[i + 1])
+
 
+def _interp_switch(t0: float, t1: float, d0: float, d1: float) -> float:
+    """Linear zero of ΔS between (t0, d0) and (t1, d1)."""
     if d1 == d0:
         return float(t0)
 